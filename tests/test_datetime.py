@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from turboeda.analyzers.datetime import _to_epoch, analyze_datetime
+
+
+def _profile(values) -> dict:
+    df = pd.DataFrame({"t": values})
+    return analyze_datetime(df, {"datetime": ["t"]})["columns"][0]
+
+
+def test_wide_span_sentinel_dates_do_not_overflow():
+    ser = pd.Series(pd.to_datetime(["1900-01-01", "2024-01-01", "2200-01-01"])).astype("datetime64[ns]")
+    info = _profile(ser)
+    tl = info["timeline"]
+    assert sum(tl["count"]) == 3
+    assert tl["start"][0].startswith("1900-01-01")
+    assert all(c >= 0 for c in tl["count"])
+
+    # Modal delta close to 2**64 ns: the 1.5x gap threshold must not overflow
+    info = _profile(pd.Series(pd.to_datetime(["1700-01-01", "2250-01-01"])).astype("datetime64[ns]"))
+    assert info["n_gaps"] == 0
+    assert sum(info["timeline"]["count"]) == 2
+
+
+def test_far_future_sentinel_keeps_bucket_count_bounded():
+    ser = pd.Series(pd.to_datetime(["2020-01-01", "2021-06-01", "9999-12-31"])).astype("datetime64[us]")
+    info = _profile(ser)
+    tl = info["timeline"]
+    assert len(tl["count"]) <= 200
+    assert sum(tl["count"]) == 3
+    assert tl["bucket"].endswith("D")
+
+
+def test_values_outside_ns_range_keep_native_unit():
+    ser = pd.Series(pd.to_datetime(["2024-01-01", "3000-01-01"])).astype("datetime64[s]")
+    info = _profile(ser)
+    assert info["timeline"]["start"][0].startswith("2024-01-01")
+    assert sum(info["timeline"]["count"]) == 2
+
+
+def test_regular_frequency_gaps_and_duplicates():
+    idx = pd.Series(pd.date_range("2024-01-01", periods=100, freq="h"))
+    ser = pd.concat([idx.drop(range(10, 20)), idx.iloc[:3]], ignore_index=True)
+    info = _profile(ser)
+    assert info["frequency"] == "1h"
+    assert info["n_gaps"] == 1
+    assert info["n_duplicates"] == 3
+    assert info["is_monotonic"] is False
+    assert info["n_nonmonotonic_stretches"] == 1
+
+
+def test_irregular_timestamps_have_no_frequency_or_gaps():
+    rng = np.random.default_rng(0)
+    ser = pd.Series(pd.to_datetime(rng.integers(1.6e18, 1.7e18, 10_000)))
+    info = _profile(ser)
+    assert info["frequency"] == "irregular"
+    assert info["n_gaps"] is None
+    assert info["largest_gaps"] == []
+
+
+def test_calendar_bands():
+    monthly = _profile(pd.Series(pd.date_range("2020-01-01", periods=36, freq="MS")))
+    assert monthly["frequency"] == "monthly (~1M)"
+    quarterly = _profile(pd.Series(pd.date_range("2015-01-01", periods=40, freq="QS")))
+    assert quarterly["frequency"] == "quarterly (~3M)"
+    assert quarterly["n_gaps"] == 0
+    four_weekly = _profile(pd.Series(pd.date_range("2020-01-01", periods=30, freq="28D")))
+    assert four_weekly["frequency"] == "28D"
+
+
+def test_tz_aware_timestamps_are_reported_in_column_tz():
+    ser = pd.Series(pd.date_range("2024-01-01", periods=48, freq="h", tz="Europe/Budapest"))
+    info = _profile(ser.drop(range(10, 20)))
+    assert info["timeline"]["start"][0] == "2024-01-01T00:00:00+01:00"
+    assert info["largest_gaps"][0]["start"].endswith("+01:00")
+
+
+def test_object_series_with_mixed_offsets():
+    ser = pd.Series(
+        [pd.Timestamp("2024-03-30 12:00+01:00"), pd.Timestamp("2024-03-31 12:00+02:00"), None],
+        dtype=object,
+    )
+    values, unit, tz = _to_epoch(ser)
+    assert values.size == 2
+    assert str(tz) == "UTC"
+
+    strings = pd.Series(["2024-03-30 12:00+01:00", "2024-03-31 12:00+02:00", "2024-04-01 12:00+02:00"])
+    info = _profile(strings)
+    assert info["n_nonnull"] == 3
+    assert info["min"] == "2024-03-30T11:00:00+00:00"
+    assert sum(info["timeline"]["count"]) == 3
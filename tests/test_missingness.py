@@ -0,0 +1,39 @@
+import warnings
+
+import numpy as np
+import pandas as pd
+
+from turboeda.analyzers.missingness import analyze_missingness
+
+
+def test_matches_pandas_reference():
+    rng = np.random.default_rng(0)
+    mask = rng.random((500, 70)) < np.linspace(0.05, 0.5, 70)
+    df = pd.DataFrame(np.where(mask, np.nan, 1.0), columns=[f"c{i}" for i in range(70)])
+    res = analyze_missingness(df, max_cols=70)
+
+    isna = df.isna()
+    ref_cooc = isna.astype(int).T @ isna.astype(int)
+    got_cooc = pd.DataFrame(res["cooccurrence"]).loc[res["columns"], res["columns"]]
+    assert (got_cooc.values == ref_cooc.loc[res["columns"], res["columns"]].values).all()
+
+    ref_corr = isna.astype(float).corr().loc[res["columns"], res["columns"]]
+    got_corr = pd.DataFrame(res["correlation"]).loc[res["columns"], res["columns"]]
+    assert np.allclose(got_corr.values, ref_corr.values, atol=1e-3)
+
+    top = isna.apply(tuple, axis=1).value_counts()
+    assert res["patterns"][0]["count"] == top.iloc[0]
+    assert res["n_incomplete_rows"] == int(isna.any(axis=1).sum())
+
+
+def test_duplicate_column_names_are_kept():
+    df = pd.DataFrame(
+        [[np.nan, 1, np.nan], [1, np.nan, np.nan], [np.nan, np.nan, 1], [1, 1, 1]],
+        columns=["a", "a", "b"],
+    )
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        res = analyze_missingness(df)
+    assert res["columns"] == ["a", "a.1", "b"]
+    assert set(res["correlation"]) == {"a", "a.1", "b"}
+    assert res["cooccurrence"]["a.1"]["a.1"] == 2
@@ -1,21 +1,209 @@
 # turboeda/analyzers/datetime.py
 from __future__ import annotations
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+import numpy as np
 import pandas as pd
 
+# Ticks per second for each datetime64 unit pandas may store
+_UNIT_PER_S = {"s": 1, "ms": 10**3, "us": 10**6, "ns": 10**9}
+_DAY_S = 86400
+
+# Candidate timeline bucket widths (seconds), smallest first; the first one that yields
+# at most `max_buckets` buckets over the observed span is used; wider spans get
+# whole-day buckets of ceil(span / max_buckets).
+_BUCKET_WIDTHS: tuple[tuple[str, int], ...] = (
+    ("1s", 1),
+    ("10s", 10),
+    ("1min", 60),
+    ("5min", 5 * 60),
+    ("15min", 15 * 60),
+    ("1h", 3600),
+    ("6h", 6 * 3600),
+    ("1D", _DAY_S),
+    ("7D", 7 * _DAY_S),
+    ("30D", 30 * _DAY_S),
+    ("365D", 365 * _DAY_S),
+)
+
+# Below this share of intervals, the most common interval is not a sampling frequency
+_MIN_FREQUENCY_SHARE = 0.5
+
+# Calendar frequencies whose interval length varies: (label, min days, max days)
+_CALENDAR_BANDS: tuple[tuple[str, int, int], ...] = (
+    ("monthly (~1M)", 28, 31),
+    ("quarterly (~3M)", 90, 92),
+    ("yearly (~1Y)", 365, 366),
+)
+
 
 def _parse_datetime_series(s: pd.Series) -> pd.Series:
     """Safely coerce a series to datetime without deprecated args.
     - If it's already a datetime dtype, return as-is.
     - Else parse with pd.to_datetime(errors='coerce') (no infer_datetime_format).
+    - Mixed UTC offsets (e.g. across DST), which newer pandas rejects, are parsed as UTC.
     """
     if pd.api.types.is_datetime64_any_dtype(s):
         return s
-    return pd.to_datetime(s, errors="coerce")
+    try:
+        return pd.to_datetime(s, errors="coerce")
+    except ValueError:
+        return pd.to_datetime(s, errors="coerce", utc=True)
+
+
+def _to_epoch(ser: pd.Series) -> Tuple[np.ndarray, str, Any]:
+    """Non-null values of a datetime series as int64 ticks since epoch in the column's
+    native unit (UTC for tz-aware), plus that unit and the column's tz (or None).
+
+    Object series (e.g. mixed UTC offsets, which pandas 2.x leaves unconverted)
+    are normalized to UTC first.
+    """
+    ser = ser.dropna()
+    if not pd.api.types.is_datetime64_any_dtype(ser):
+        ser = pd.to_datetime(ser, utc=True, errors="coerce").dropna()
+    tz = None
+    if isinstance(ser.dtype, pd.DatetimeTZDtype):
+        tz = ser.dt.tz
+        ser = ser.dt.tz_convert("UTC").dt.tz_localize(None)
+    unit = ser.dt.unit
+    return ser.to_numpy(dtype=f"datetime64[{unit}]").view(np.int64), unit, tz
+
+
+def _to_iso(value: int, unit: str, tz: Any = None) -> str:
+    """ISO8601 string of an epoch value, shown in the column's tz like min/max."""
+    ts = pd.Timestamp(np.datetime64(int(value), unit))
+    if tz is not None:
+        ts = ts.tz_localize("UTC").tz_convert(tz)
+    return ts.isoformat()
+
+
+def _format_duration(delta: int, unit: str) -> str:
+    """Readable duration of `delta` ticks; falls back to days beyond the Timedelta range."""
+    try:
+        return str(pd.Timedelta(int(delta), unit=unit))
+    except (OverflowError, ValueError):
+        return f"{int(delta) // (_UNIT_PER_S[unit] * _DAY_S)} days"
+
+
+def _frequency_label(delta: int, unit: str) -> str:
+    """Human-readable label for a fixed sampling interval (e.g. '1h', '15min', '28D')."""
+    per_day = _UNIT_PER_S[unit] * _DAY_S
+    if delta % per_day == 0:
+        return f"{delta // per_day}D"  # pandas 3 spells whole days in hours
+    try:
+        alias = pd.tseries.frequencies.to_offset(pd.Timedelta(int(delta), unit=unit)).freqstr
+    except (OverflowError, ValueError):
+        return _format_duration(delta, unit)
+    return alias if alias[:1].isdigit() else f"1{alias}"
+
+
+def _time_profile(
+    values: np.ndarray, unit: str, tz: Any = None, max_buckets: int = 200, max_gaps: int = 5
+) -> Dict[str, Any]:
+    """Vectorized time profile of int64 epoch values in `unit` (in original row order).
+
+    - frequency: mode of the positive deltas between sorted timestamps, or a calendar
+      band (monthly/quarterly/yearly) when deltas vary within it, or "irregular"
+      when it covers less than half of the intervals
+    - gaps: sorted deltas larger than 1.5x the dominant interval (regular columns only)
+    - duplicates / non-monotonic stretches: from sorted and original-order values
+    - timeline: row counts per adaptive bucket via np.bincount
+
+    Differences are taken in uint64: sorted values make them non-negative, and the
+    wrap-around keeps them exact even when an int64 subtraction would overflow.
+    """
+    n = values.size
+    out: Dict[str, Any] = {
+        "frequency": None,
+        "frequency_share": None,
+        "n_duplicates": 0,
+        "is_monotonic": True,
+        "n_backward_steps": 0,
+        "n_nonmonotonic_stretches": 0,
+        "n_gaps": 0,
+        "largest_gaps": [],
+        "timeline": None,
+    }
+    if n == 0:
+        return out
+
+    # Monotonicity in original order: runs of backward steps (compare, don't subtract)
+    step_back = values[1:] < values[:-1]
+    n_back = int(np.count_nonzero(step_back))
+    out["is_monotonic"] = n_back == 0
+    out["n_backward_steps"] = n_back
+    if n_back:
+        out["n_nonmonotonic_stretches"] = int(np.count_nonzero(step_back[1:] & ~step_back[:-1]) + step_back[0])
+
+    srt = np.sort(values)
+    offsets = srt.view(np.uint64) - srt[:1].view(np.uint64)  # exact, >= 0
+    deltas = np.diff(offsets)
+    out["n_duplicates"] = int(np.count_nonzero(deltas == 0))
+    per_day = _UNIT_PER_S[unit] * _DAY_S
+
+    pos = deltas[deltas > 0]
+    if pos.size:
+        uniq, counts = np.unique(pos, return_counts=True)
+        best = int(np.argmax(counts))
+        mode = int(uniq[best])
+        label = _frequency_label(mode, unit)
+        share = float(counts[best]) / pos.size
+        gap_above = mode
+        # Calendar frequencies vary in length: when the mode falls in a band and the
+        # deltas really vary within it, count the whole band and gap above its top
+        for band_label, lo_d, hi_d in _CALENDAR_BANDS:
+            if lo_d * per_day <= mode <= hi_d * per_day:
+                in_band = (uniq >= lo_d * per_day) & (uniq <= hi_d * per_day)
+                if np.count_nonzero(in_band) > 1:
+                    label = band_label
+                    share = float(counts[in_band].sum()) / pos.size
+                    gap_above = hi_d * per_day
+                break
+        out["frequency_share"] = round(share, 4)
+
+        if share < _MIN_FREQUENCY_SHARE:
+            out["frequency"] = "irregular"
+            out["n_gaps"] = None
+        else:
+            out["frequency"] = label
+            # delta > 1.5 * gap_above, evaluated in uint64 without overflowing
+            above = np.uint64(gap_above)
+            is_gap = (deltas > above) & (deltas - above > np.uint64(gap_above // 2))
+            gap_idx = np.flatnonzero(is_gap)
+            out["n_gaps"] = int(gap_idx.size)
+            if gap_idx.size:
+                k = min(max_gaps, gap_idx.size)
+                top = gap_idx[np.argsort(deltas[gap_idx], kind="stable")[::-1][:k]]
+                out["largest_gaps"] = [
+                    {
+                        "start": _to_iso(srt[i], unit, tz),
+                        "end": _to_iso(srt[i + 1], unit, tz),
+                        "duration": _format_duration(deltas[i], unit),
+                    }
+                    for i in top
+                ]
+
+    # Timeline: only bucket counts leave this function (at most max_buckets of them)
+    span = int(offsets[-1])
+    max_buckets = max(2, max_buckets)
+    for label, width_s in _BUCKET_WIDTHS:
+        width = width_s * _UNIT_PER_S[unit]
+        if span // width + 1 <= max_buckets:
+            break
+    else:
+        days = -(-(span // (max_buckets - 1) + 1) // per_day)  # whole days, span // width < max_buckets
+        label, width = f"{days}D", days * per_day
+    counts = np.bincount((offsets // np.uint64(width)).astype(np.intp))
+    starts = srt[0] + np.arange(counts.size, dtype=np.int64) * width  # <= srt[-1], no overflow
+    out["timeline"] = {
+        "bucket": label,
+        "start": [_to_iso(v, unit, tz) for v in starts],
+        "count": counts.tolist(),
+    }
+    return out
 
 
-def analyze_datetime(df: pd.DataFrame, roles: Dict[str, list[str]]) -> Dict[str, Any]:
-    """Analyze datetime-like columns and return basic stats for the report.
+def analyze_datetime(df: pd.DataFrame, roles: Dict[str, list[str]], max_buckets: int = 200) -> Dict[str, Any]:
+    """Analyze datetime-like columns and return basic stats plus a time profile for the report.
 
     Returns dict with:
       {
@@ -29,6 +217,15 @@ def analyze_datetime(df: pd.DataFrame, roles: Dict[str, list[str]]) -> Dict[str,
               "min": str|None,  # ISO8601 if available
               "max": str|None,  # ISO8601 if available
               "examples": list[str],  # first few non-null examples
+              "frequency": str|None,  # dominant interval (mode of deltas), calendar band, or "irregular"
+              "frequency_share": float|None,  # share of deltas equal to that interval
+              "n_duplicates": int,  # repeated timestamps
+              "is_monotonic": bool,  # non-decreasing in row order
+              "n_backward_steps": int,
+              "n_nonmonotonic_stretches": int,
+              "n_gaps": int|None,  # deltas > 1.5x the dominant interval; None if irregular
+              "largest_gaps": list[dict],  # {"start", "end", "duration"}
+              "timeline": {"bucket": str, "start": list[str], "count": list[int]}|None,
             },
             ...
         ]
@@ -50,7 +247,7 @@ def analyze_datetime(df: pd.DataFrame, roles: Dict[str, list[str]]) -> Dict[str,
             max_val = ser.max()
             min_iso = min_val.isoformat() if pd.notna(min_val) else None
             max_iso = max_val.isoformat() if pd.notna(max_val) else None
-            examples = [str(x) for x in ser.dropna().astype(str).head(3).tolist()]
+            examples = [str(x) for x in ser.dropna().head(3).astype(str).tolist()]
         else:
             min_iso = None
             max_iso = None
@@ -65,6 +262,7 @@ def analyze_datetime(df: pd.DataFrame, roles: Dict[str, list[str]]) -> Dict[str,
                 "min": min_iso,
                 "max": max_iso,
                 "examples": examples,
+                **_time_profile(*_to_epoch(ser), max_buckets=max_buckets),
             }
         )
 
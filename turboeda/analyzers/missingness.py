@@ -0,0 +1,132 @@
+from __future__ import annotations
+import numpy as np
+import pandas as pd
+
+# Popcount per byte, used when np.bitwise_count (NumPy >= 2.0) is unavailable
+_POPCOUNT_U8 = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def _pack_words(mask: np.ndarray) -> np.ndarray:
+    """Pack a 2-D bool mask along axis 1 into uint64 words (64 bits per word).
+
+    Bits are padded with zeros up to a whole number of words, so a (n, k) mask
+    becomes a (n, ceil(k / 64)) uint64 matrix.
+    """
+    n, k = mask.shape
+    n_words = max(1, -(-k // 64))
+    packed = np.packbits(mask, axis=1)  # (n, ceil(k / 8)) uint8
+    padded = np.zeros((n, n_words * 8), dtype=np.uint8)
+    padded[:, : packed.shape[1]] = packed
+    return padded.view(np.uint64)
+
+
+def _popcount_sum(words: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Number of set bits in `words`, summed along `axis`."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=axis, dtype=np.int64)
+    as_bytes = words.view(np.uint8).reshape(words.shape[:-1] + (-1,))
+    return _POPCOUNT_U8[as_bytes].sum(axis=axis, dtype=np.int64)
+
+
+def _hash_rows(words: np.ndarray) -> np.ndarray:
+    """Fold each row of packed uint64 words into a single uint64 key."""
+    if words.shape[1] == 1:
+        return words[:, 0].copy()  # exact: the pattern fits in one word
+    h = np.full(words.shape[0], 0xCBF29CE484222325, dtype=np.uint64)
+    prime = np.uint64(0x100000001B3)
+    with np.errstate(over="ignore"):
+        for j in range(words.shape[1]):  # loops over words (k / 64), not rows
+            h ^= words[:, j]
+            h *= prime
+            h ^= h >> np.uint64(29)
+    return h
+
+
+def _unique_labels(columns) -> list[str]:
+    """String labels with duplicates suffixed '.1', '.2', ... (like pandas' CSV reader)."""
+    seen: dict[str, int] = {}
+    out = []
+    for c in map(str, columns):
+        if c in seen:
+            seen[c] += 1
+            label = f"{c}.{seen[c]}"
+            while label in seen:
+                seen[c] += 1
+                label = f"{c}.{seen[c]}"
+            c = label
+        seen.setdefault(c, 0)
+        out.append(c)
+    return out
+
+
+def analyze_missingness(df: pd.DataFrame, max_cols: int = 40, top_patterns: int = 10) -> dict:
+    """Nullity co-occurrence, nullity correlation and most frequent missing-row patterns.
+
+    The isna() mask is packed into uint64 bit matrices (64 columns or rows per word),
+    so pairwise co-occurrence counts are popcounts of AND-ed words and row patterns
+    are grouped by a hash of their packed words.
+    Only columns with partial missingness (not 0% and not 100%) enter the
+    co-occurrence/correlation matrices, capped to the `max_cols` most-missing ones.
+    """
+    n_rows, n_cols = df.shape
+    columns = _unique_labels(df.columns)  # dict keys below must be unique
+    if n_rows == 0 or n_cols == 0:
+        return {"n_rows": int(n_rows), "n_incomplete_rows": 0, "columns": [], "counts": {},
+                "cooccurrence": None, "correlation": None, "patterns": []}
+
+    mask = df.isna().to_numpy(dtype=bool)
+    col_counts = mask.sum(axis=0, dtype=np.int64)
+
+    # --- Row patterns: one packed bit-row per record, grouped by hash
+    row_words = _pack_words(mask)
+    keys = _hash_rows(row_words)
+    _, first_idx, counts = np.unique(keys, return_index=True, return_counts=True)
+    order = np.argsort(-counts, kind="stable")[:top_patterns]
+    patterns = []
+    for i in order:
+        missing_idx = np.flatnonzero(mask[first_idx[i]])
+        patterns.append(
+            {
+                "count": int(counts[i]),
+                "ratio": round(float(counts[i]) / n_rows, 4),
+                "n_missing_cols": int(missing_idx.size),
+                "missing_cols": [columns[j] for j in missing_idx],
+            }
+        )
+    n_incomplete = int(np.count_nonzero(row_words.any(axis=1)))
+
+    # --- Column co-occurrence: one packed bit-row per column
+    partial = np.flatnonzero((col_counts > 0) & (col_counts < n_rows))
+    partial = partial[np.argsort(-col_counts[partial], kind="stable")][:max_cols]
+    partial = np.sort(partial)  # keep original column order in the matrices
+    sel = [columns[j] for j in partial]
+
+    cooc_out = corr_out = None
+    if len(partial) >= 2:
+        col_words = _pack_words(np.ascontiguousarray(mask[:, partial].T))  # (k, n_rows / 64)
+        k = len(partial)
+        cooc = np.empty((k, k), dtype=np.int64)
+        for i in range(k):  # k <= max_cols rows of AND+popcount over all words
+            cooc[i] = _popcount_sum(col_words[i] & col_words, axis=1)
+
+        # Phi coefficient of the binary isna() indicators
+        n1 = np.diag(cooc).astype(np.float64)
+        n0 = n_rows - n1
+        denom = np.sqrt(np.outer(n1 * n0, n1 * n0))
+        num = n_rows * cooc.astype(np.float64) - np.outer(n1, n1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr = np.where(denom > 0, num / denom, np.nan)
+        corr = np.clip(corr, -1.0, 1.0)
+
+        cooc_out = pd.DataFrame(cooc, index=sel, columns=sel).to_dict()
+        corr_out = pd.DataFrame(corr, index=sel, columns=sel).round(3).to_dict()
+
+    return {
+        "n_rows": int(n_rows),
+        "n_incomplete_rows": n_incomplete,
+        "columns": sel,
+        "counts": {columns[j]: int(col_counts[j]) for j in partial},
+        "cooccurrence": cooc_out,
+        "correlation": corr_out,
+        "patterns": patterns,
+    }
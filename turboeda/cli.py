@@ -21,8 +21,11 @@ def report(
     ),
     sample_rows: int | None = typer.Option(200_000, help="Sample size for large files (None for full)."),
     max_corr_cols: int = typer.Option(40, help="Max number of columns to include in correlation matrix."),
+    max_missing_cols: int = typer.Option(40, help="Max number of columns to include in the nullity correlation heatmap."),
+    top_missing_patterns: int = typer.Option(10, help="Number of most frequent missingness row patterns to list."),
     max_numeric_plots: int = typer.Option(12, help="Max numeric columns to plot histograms for."),
     max_categorical_plots: int = typer.Option(12, help="Max categorical columns to plot bar charts for."),
+    max_datetime_plots: int = typer.Option(12, help="Max datetime columns to plot timelines for."),
     theme: str = typer.Option("dark", "--theme", help="Report theme: 'dark' or 'light'.", show_default=True),
     open_browser: bool = typer.Option(False, "--open/--no-open", help="Open the report in the default browser after writing."),
     profile: str = typer.Option("standard", help="Profile: quick|standard|deep (affects analyses)."),
@@ -39,8 +42,11 @@ def report(
         sheet=sheet,
         sample_rows=sample_rows,
         max_corr_cols=max_corr_cols,
+        max_missing_cols=max_missing_cols,
+        top_missing_patterns=top_missing_patterns,
         max_numeric_plots=max_numeric_plots,
         max_categorical_plots=max_categorical_plots,
+        max_datetime_plots=max_datetime_plots,
         theme=theme,
     )
 
@@ -11,6 +11,7 @@ from .analyzers.numeric import analyze_numeric
 from .analyzers.categorical import analyze_categorical
 from .analyzers.datetime import analyze_datetime
 from .analyzers.correlation import analyze_correlations
+from .analyzers.missingness import analyze_missingness
 from .report.renderer import HTMLRenderer
 
 
@@ -26,9 +27,14 @@ class EDAReport:
     # Correlation config
     max_corr_cols: int = 40
 
+    # Missingness config
+    max_missing_cols: int = 40
+    top_missing_patterns: int = 10
+
     # Plot quotas
     max_numeric_plots: int = 12
     max_categorical_plots: int = 12
+    max_datetime_plots: int = 12
 
     # Theming
     theme: str = "dark"  # 'dark' or 'light'
@@ -48,6 +54,7 @@ class EDAReport:
         categorical = analyze_categorical(df, roles)
         dt = analyze_datetime(df, roles)
         corrs = analyze_correlations(df, roles, max_cols=self.max_corr_cols)
+        missing = analyze_missingness(df, max_cols=self.max_missing_cols, top_patterns=self.top_missing_patterns)
 
         self._df = df
         self._result = {
@@ -57,6 +64,7 @@ class EDAReport:
             "categorical": categorical,
             "datetime": dt,
             "correlations": corrs,
+            "missingness": missing,
         }
 
         # Optional: immediately save and open the report after analysis finishes
@@ -79,6 +87,7 @@ class EDAReport:
             df=self._df,
             max_numeric_plots=self.max_numeric_plots,
             max_categorical_plots=self.max_categorical_plots,
+            max_datetime_plots=self.max_datetime_plots,
             theme=self.theme,
         )
         p = Path(out_path)
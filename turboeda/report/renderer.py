@@ -7,7 +7,9 @@ from pathlib import Path
 from ..viz.plots import (
     numeric_histograms,
     categorical_bars,
+    datetime_timelines,
     correlation_heatmap,
+    nullity_heatmap,
 )
 
 @dataclass
@@ -24,6 +26,7 @@ class HTMLRenderer:
         df,
         max_numeric_plots: int = 12,
         max_categorical_plots: int = 12,
+        max_datetime_plots: int = 12,
         theme: str = "dark",
     ) -> str:
         tdir = self._get_template_dir()
@@ -37,6 +40,7 @@ class HTMLRenderer:
         summary_t = env.get_template("sections/summary.html")
         vars_t = env.get_template("sections/variables.html")
         corr_t = env.get_template("sections/correlations.html")
+        miss_t = env.get_template("sections/missingness.html")
 
         roles = result["roles"]
 
@@ -46,11 +50,15 @@ class HTMLRenderer:
 
         numeric_figs = numeric_histograms(df, numeric_cols, theme=theme) if numeric_cols else []
         categorical_figs = categorical_bars(df, categorical_cols, theme=theme) if categorical_cols else []
+        datetime_figs = datetime_timelines(result["datetime"]["columns"][:max_datetime_plots], theme=theme)
 
         # Correlation figures
         pearson_div = correlation_heatmap(result["correlations"]["pearson"], "Pearson correlation", theme=theme)
         spearman_div = correlation_heatmap(result["correlations"]["spearman"], "Spearman correlation", theme=theme)
 
+        # Missingness figure
+        nullity_div = nullity_heatmap(result["missingness"]["correlation"], theme=theme)
+
         html = base.render(
             theme=theme,
             summary_section=summary_t.render(summary=result["summary"], roles=roles),
@@ -60,6 +68,11 @@ class HTMLRenderer:
                 dt=result["datetime"],
                 numeric_figs=numeric_figs,
                 categorical_figs=categorical_figs,
+                datetime_figs=datetime_figs,
+            ),
+            missingness_section=miss_t.render(
+                miss=result["missingness"],
+                nullity_div=nullity_div,
             ),
             correlations_section=corr_t.render(
                 pearson_div=pearson_div,
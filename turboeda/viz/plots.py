@@ -50,6 +50,20 @@ def categorical_bars(df: pd.DataFrame, cols: list[str], theme: str = "dark") ->
         out.append({"col": c, "div": div})
     return out
 
+def datetime_timelines(dt_columns: list[dict], theme: str = "dark") -> list[dict]:
+    """Create row-count-over-time bar charts from pre-aggregated timeline buckets. Returns list of {col, div}."""
+    out = []
+    for info in dt_columns:
+        tl = info.get("timeline")
+        if not tl:
+            continue
+        fig = px.bar(x=tl["start"], y=tl["count"], title=f"Rows over time ({tl['bucket']} buckets) – {info['name']}")
+        fig.update_layout(xaxis_title=info["name"], yaxis_title="count", bargap=0)
+        _apply_plotly_theme(fig, theme)
+        div = fig_to_html_div(fig)
+        out.append({"col": info["name"], "div": div})
+    return out
+
 def correlation_heatmap(
     corr_input: dict | pd.DataFrame | None,
     title: str,
@@ -97,3 +111,30 @@ def correlation_heatmap(
     fig.update_layout(coloraxis_colorbar_title="corr")
     _apply_plotly_theme(fig, theme)
     return fig_to_html_div(fig)
+
+def nullity_heatmap(corr_input: dict | None, theme: str = "dark") -> str | None:
+    """
+    Compact heatmap of nullity correlation (phi of the isna() indicators).
+    Cell labels are only drawn for small matrices to keep wide tables readable.
+    Returns a Plotly <div> string or None if fewer than 2 columns are available.
+    """
+    if not corr_input:
+        return None
+    df = pd.DataFrame(corr_input)
+    if df.shape[1] < 2:
+        return None
+
+    fig = px.imshow(
+        df,
+        text_auto=".2f" if df.shape[1] <= 15 else False,
+        aspect="auto",
+        title="Nullity correlation",
+        zmin=-1,
+        zmax=1,
+        color_continuous_scale="RdBu_r",
+    )
+    fig.update_layout(coloraxis_colorbar_title="corr")
+    fig.update_xaxes(showticklabels=df.shape[1] <= 60)
+    fig.update_yaxes(showticklabels=df.shape[1] <= 60)
+    _apply_plotly_theme(fig, theme)
+    return fig_to_html_div(fig)